@@ -15,29 +15,33 @@ Available commands:
 
 import sys
 import os
-from pathlib import Path
 from typing import Tuple
 
 # Include project root in path so imports work correctly
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from src.trie import Trie
-from src.io_utils import load_csv, save_csv
+from src.io_utils import load_csv, load_csv_mmap, save_csv
 
+# files at least this large are parsed from a memory map
+MMAP_MIN_BYTES = 64 * 1024 * 1024
 
-def handle_load(file_path: str) -> "Trie":
-    """Create a new Trie populated with data from CSV file."""
-    path = Path(file_path)
-    data = load_csv(path)
+
+def handle_load(trie: "Trie", file_path: str) -> "Trie":
+    """Create a new Trie populated with data from CSV file (replaces trie)."""
+    try:
+        large = os.path.getsize(file_path) >= MMAP_MIN_BYTES
+    except OSError:
+        large = False  # let load_csv report the problem
+    data = load_csv_mmap(file_path) if large else load_csv(file_path)
     trie = Trie()
-    for word, freq in data:
-        trie.insert(word, freq)
+    trie.insert_many(data)
     return trie
 
 
 def handle_save(trie: "Trie", file_path: str) -> None:
     """Save trie data (word, freq) pairs into CSV file."""
-    save_csv(Path(file_path), trie.items())
+    save_csv(file_path, trie.iter_items())
 
 
 def handle_insert(trie: "Trie", word: str, freq: str) -> None:
@@ -68,38 +72,44 @@ def handle_stats(trie: "Trie") -> None:
     print(f"words={total_words} height={height} nodes={nodes}")
 
 
+# command -> (handler, number of arguments or None for any); handlers
+# take (trie, *args) and return a replacement Trie or None
+COMMANDS = {
+    "load": (handle_load, 1),
+    "save": (handle_save, 1),
+    "insert": (handle_insert, 2),
+    "remove": (handle_remove, 1),
+    "contains": (handle_contains, 1),
+    "complete": (handle_complete, 2),
+    "stats": (handle_stats, None),
+}
+
+
 def execute_command(line: str, trie: "Trie") -> Tuple[bool, "Trie"]:
     """Interpret and execute a single CLI command."""
-    parts = line.strip().split()
+    parts = line.split()
     if not parts:
         return True, trie
 
     cmd = parts[0].lower()
+    if cmd == "quit":
+        return False, trie
 
-    try:
-        if cmd == "quit":
-            return False, trie
-
-        elif cmd == "load" and len(parts) == 2:
-            trie = handle_load(parts[1])
-
-        elif cmd == "save" and len(parts) == 2:
-            handle_save(trie, parts[1])
-
-        elif cmd == "insert" and len(parts) == 3:
-            handle_insert(trie, parts[1], parts[2])
-
-        elif cmd == "remove" and len(parts) == 2:
-            handle_remove(trie, parts[1])
-
-        elif cmd == "contains" and len(parts) == 2:
-            handle_contains(trie, parts[1])
-
-        elif cmd == "complete" and len(parts) == 3:
-            handle_complete(trie, parts[1], parts[2])
+    entry = COMMANDS.get(cmd)
+    if entry is None:
+        return True, trie
+    handler, nargs = entry
+    if nargs is None:
+        args = ()
+    elif len(parts) - 1 == nargs:
+        args = parts[1:]
+    else:
+        return True, trie
 
-        elif cmd == "stats":
-            handle_stats(trie)
+    try:
+        result = handler(trie, *args)
+        if result is not None:
+            trie = result
 
     except FileNotFoundError:
         print(f"ERROR: File not found - {parts[1]}", file=sys.stderr)
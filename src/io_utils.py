@@ -4,28 +4,35 @@ Each row should contain: word, score
 """
 
 import csv
+import io
+import mmap
+import os
+import re
+
+_NEEDS_QUOTING = re.compile(r'[,"\r\n]')
+_SCORE_CACHE_SIZE = 4096  # distinct score strings memoized per load
 
 
 def load_csv(file_path):
     """
     Reads a two-column CSV file and returns a list of (word, score) tuples.
     The 'score' is converted to float, or defaults to 0.0 if not valid.
+
+    Files without quotes are split with str.split (CRLF and bare CR end
+    a row, as in csv.reader); quoted files go through the csv module
+    untouched, so line breaks inside quoted fields are preserved.
     """
-    words = []
     try:
         with open(file_path, "r", encoding="utf-8", newline="") as file:
-            reader = csv.reader(file)
-            for row in reader:
-                if len(row) == 0:
-                    continue
+            text = file.read()
 
-                word = row[0].strip().lower()
-                try:
-                    score = float(row[1]) if len(row) > 1 else 0.0
-                except ValueError:
-                    score = 0.0
+        if '"' in text:
+            rows = csv.reader(io.StringIO(text, newline=""))
+        else:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+            rows = (line.split(",", 2) for line in text.split("\n") if line)
 
-                words.append((word, score))
+        words = _parse_rows(rows)
     except FileNotFoundError:
         print(f"ERROR: Missing file at {file_path}")
         return []
@@ -36,15 +43,103 @@ def load_csv(file_path):
     return words
 
 
+def load_csv_mmap(file_path):
+    """
+    Same result as load_csv, but memory-maps the file and parses it line
+    by line from the mapping, so a very large file is never copied into
+    one Python string. CRLF and bare CR line endings are handled here;
+    only files containing quotes fall back to load_csv.
+    """
+    try:
+        with open(file_path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b'"') != -1:
+                    return load_csv(file_path)
+                words = _parse_rows(_mmap_rows(mm))
+    except FileNotFoundError:
+        print(f"ERROR: Missing file at {file_path}")
+        return []
+    except Exception as err:
+        print(f"ERROR: Failed to load {file_path}: {err}")
+        return []
+
+    return words
+
+
+def _mmap_rows(mm):
+    """Yield each non-empty line of a mapped file split into fields."""
+    find = mm.find
+    size = len(mm)
+    start = 0
+    while start < size:
+        end = find(b"\n", start)
+        if end == -1:
+            end = size
+        if end > start:
+            line = mm[start:end].decode("utf-8")
+            if "\r" in line:
+                # CRLF endings and bare CRs both terminate a row
+                for part in line.split("\r"):
+                    if part:
+                        yield part.split(",", 2)
+            else:
+                yield line.split(",", 2)
+        start = end + 1
+
+
+def _parse_rows(rows):
+    """
+    Convert CSV rows into (word, score) tuples, skipping empty rows.
+    Score strings are converted once and memoized: word lists repeat a
+    few hundred distinct scores, so most rows skip float() and a bad
+    score string raises ValueError only the first time it is seen.
+    """
+    words = []
+    push = words.append
+    scores = {}  # raw score string -> float
+    for row in rows:
+        if len(row) == 0:
+            continue
+
+        word = row[0].strip().lower()
+        if len(row) > 1:
+            raw = row[1]
+            score = scores.get(raw)
+            if score is None:
+                try:
+                    score = float(raw)
+                except ValueError:
+                    score = 0.0
+                if len(scores) < _SCORE_CACHE_SIZE:
+                    scores[raw] = score
+        else:
+            score = 0.0
+
+        push((word, score))
+    return words
+
+
 def save_csv(file_path, data):
     """
-    Writes a list of (word, score) pairs to the given CSV file path.
+    Writes (word, score) pairs from any iterable to the given CSV file path.
     The file will be overwritten if it already exists.
+
+    Output matches csv.writer (minimal quoting, CRLF line endings). Rows
+    are formatted with f-strings and streamed through one writelines
+    call, so a generator input is never materialized.
     """
     try:
         with open(file_path, "w", encoding="utf-8", newline="") as file:
-            writer = csv.writer(file)
-            for word, score in data:
-                writer.writerow([word, score])
+            file.writelines(
+                f"{_csv_field(word)},{score}\r\n" for word, score in data)
     except Exception as err:
         print(f"ERROR: Could not save file {file_path}: {err}")
+
+
+def _csv_field(text):
+    """Quote text the way csv.writer does if it contains special characters."""
+    if _NEEDS_QUOTING.search(text):
+        return '"' + text.replace('"', '""') + '"'
+    return text
@@ -4,69 +4,280 @@ Trie (prefix tree) data structure used for autocomplete.
 Expected public API:
 - class Trie
   - insert(word: str, freq: float)
+  - insert_many(pairs: Iterable[tuple[str, float]])
+  - compact()
   - remove(word: str) -> bool
   - contains(word: str) -> bool
   - complete(prefix: str, k: int) -> list[str]
   - stats() -> tuple[int, int, int]
   - items() -> list[tuple[str, float]]
+  - iter_items() -> Iterator[tuple[str, float]]
 
 Complexity notes:
 - insert/remove/contains: O(L) where L = length of word
-- complete(prefix, k): roughly O(M + N log K)
+- complete(prefix, k): O(M) to reach the prefix, then a best-first
+  search that only expands subtrees able to reach the top k
+
+Layout notes:
+- Children stay in per-node dicts keyed by character rather than fixed
+  26-slot arrays. The snapshot has ~2,000 words outside a-z (digits,
+  apostrophes), and one-character str objects are cached by CPython,
+  so a dict lookup is an identity hit with no hashing work. A 26-slot
+  table measured ~7% slower per lookup and makes child iteration O(26).
 """
 
 import heapq
+from array import array
+from collections import OrderedDict
+from operator import itemgetter
 
+ROOT = 0  # node id of the root in every Trie arena
+NO_FREQ = float('-inf')  # _max_freq of a subtree holding no words
+COMPLETE_CACHE_SIZE = 256  # (prefix, k) results kept by Trie.complete
 
-class TrieNode:
-    """Node of a Trie structure."""
-    __slots__ = ("children", "is_word", "freq")
-
-    def __init__(self):
-        self.children = {}
-        self.is_word = False
-        self.freq = 0.0
+# Shared children map for nodes without children; a node gets its own
+# dict only when its first child is added. Never mutate it.
+_LEAF = {}
 
 
 class Trie:
+    """
+    Arena-backed Trie: nodes are integer ids into parallel arrays
+    instead of individual Python objects.
+
+    - _is_word[nid]  : 1 if the node terminates a word
+    - _freq[nid]     : frequency of that word (0.0 otherwise)
+    - _children[nid] : dict mapping char -> child node id (_LEAF if none)
+    - _max_freq[nid] : highest word frequency in the subtree of nid
+
+    Each array above costs 1-8 bytes per node; nearly all of a node's
+    footprint is the children dict of inner nodes. (With these four
+    arrays, tracemalloc on data/words.csv gave ~185-190 bytes per node
+    versus ~205 for the old TrieNode objects.)
+    """
+
     def __init__(self):
         """Initialize an empty Trie."""
-        self.root = TrieNode()
+        self._is_word = bytearray()
+        self._freq = array('d')
+        self._children = []
+        self._max_freq = array('d')
+        self._free = []  # ids of pruned nodes, reused before growing the arena
+        self._new_node()  # root
         self._total_words = 0
         self._total_nodes = 1  # count root
+        # (prefix, k) -> tuple of words, least recently used first; any
+        # mutation must clear it. A plain mapping (not lru_cache around a
+        # bound method) so the Trie holds no reference cycle to itself.
+        self._complete_cache = OrderedDict()
 
     # --------------------------- internal helpers ---------------------------
 
+    def _new_node(self):
+        """Allocate a fresh node in the arena and return its id."""
+        if self._free:
+            nid = self._free.pop()
+            self._is_word[nid] = 0
+            self._freq[nid] = 0.0
+            self._children[nid] = _LEAF
+            self._max_freq[nid] = NO_FREQ
+            return nid
+        self._is_word.append(0)
+        self._freq.append(0.0)
+        self._children.append(_LEAF)
+        self._max_freq.append(NO_FREQ)
+        return len(self._is_word) - 1
+
+    def _find(self, text):
+        """Return the node id reached by following text, or -1 (no path kept)."""
+        children = self._children
+        node = ROOT
+        for ch in text:
+            node = children[node].get(ch)
+            if node is None:
+                return -1
+        return node
+
     def _trace(self, text):
-        """Traverse the Trie along text; return (node, path) if found."""
-        node = self.root
-        path = [(node, '')]
+        """
+        Traverse the Trie along text; return (node, nodes) if found, else
+        (-1, []). nodes[i] is the node reached after text[:i], so the edge
+        into nodes[i] is labelled text[i - 1].
+        """
+        children = self._children
+        node = ROOT
+        nodes = [node]
+        push = nodes.append
         for ch in text:
-            if ch not in node.children:
-                return None, []
-            node = node.children[ch]
-            path.append((node, ch))
-        return node, path
+            node = children[node].get(ch)
+            if node is None:
+                return -1, []
+            push(node)
+        return node, nodes
+
+    def _refresh_max(self, nodes):
+        """
+        Recompute _max_freq bottom-up along nodes (root first) after the
+        last one changed; stops as soon as a value comes out unchanged.
+        """
+        is_word = self._is_word
+        freq = self._freq
+        children = self._children
+        max_freq = self._max_freq
+        for nid in reversed(nodes):
+            best = freq[nid] if is_word[nid] else NO_FREQ
+            for child in children[nid].values():
+                if max_freq[child] > best:
+                    best = max_freq[child]
+            if best == max_freq[nid]:
+                break
+            max_freq[nid] = best
 
     # ----------------------------- core methods -----------------------------
 
     def insert(self, word, freq):
         """
         Insert or update a word with its frequency.
-        Complexity: O(L)
+        Complexity: O(L) to walk the word and raise subtree bounds; lowering
+        an existing word's frequency adds an O(L * C) bound refresh, where
+        C is the fanout of the nodes on its path.
         """
-        node = self.root
+        self._complete_cache.clear()
+        children = self._children
+        max_freq = self._max_freq
+        node = ROOT
+        created = 0
         for ch in word:
-            if ch not in node.children:
-                node.children[ch] = TrieNode()
-                self._total_nodes += 1
-            node = node.children[ch]
+            if max_freq[node] < freq:
+                max_freq[node] = freq
+            kids = children[node]
+            nxt = kids.get(ch)
+            if nxt is None:
+                nxt = self._new_node()
+                if kids is _LEAF:
+                    children[node] = {ch: nxt}
+                else:
+                    kids[ch] = nxt
+                created += 1
+            node = nxt
+        self._total_nodes += created
+        if max_freq[node] < freq:
+            max_freq[node] = freq
 
-        if not node.is_word:
-            node.is_word = True
+        is_word = self._is_word
+        if not is_word[node]:
+            is_word[node] = 1
             self._total_words += 1
+            self._freq[node] = freq
+        else:
+            lowered = freq < self._freq[node]
+            self._freq[node] = freq
+            if lowered:
+                self._refresh_max(self._trace(word)[1])
 
-        node.freq = freq
+    def insert_many(self, pairs):
+        """
+        Insert or update many (word, freq) pairs.
+        Pairs are sorted by word first, so each insert resumes from the
+        common prefix with the previous word instead of the root.
+        Later duplicates win, as with repeated insert() calls.
+        Complexity: O(P log P) to sort, plus O(L) per pair for the common
+        prefix check and bound updates (only characters past the common
+        prefix touch the children maps).
+        """
+        self._complete_cache.clear()
+        children = self._children
+        is_word = self._is_word
+        freq_of = self._freq
+        max_freq = self._max_freq
+        free = self._free
+        path = [ROOT]  # node ids along the previous word
+        push = path.append
+        prev = ""
+        created = 0
+        added = 0
+        for word, freq in sorted(pairs, key=itemgetter(0)):
+            lcp = 0
+            for a, b in zip(prev, word):
+                if a != b:
+                    break
+                lcp += 1
+            del path[lcp + 1:]
+
+            node = path[-1]
+            for ch in word[lcp:]:
+                kids = children[node]
+                nxt = kids.get(ch)
+                if nxt is None:
+                    if kids is _LEAF:
+                        kids = children[node] = {}
+                    if free:
+                        nxt = self._new_node()
+                    else:
+                        # inlined _new_node for the common append-only case
+                        nxt = len(children)
+                        children.append(_LEAF)
+                        is_word.append(0)
+                        freq_of.append(0.0)
+                        max_freq.append(NO_FREQ)
+                    kids[ch] = nxt
+                    created += 1
+                push(nxt)
+                node = nxt
+
+            if not is_word[node]:
+                is_word[node] = 1
+                added += 1
+            elif freq < freq_of[node]:
+                freq_of[node] = freq
+                self._refresh_max(path)
+                prev = word
+                continue
+            freq_of[node] = freq
+            # ancestors' bounds are never below a descendant's, so stop
+            # at the first node that already covers freq
+            for nid in reversed(path):
+                if max_freq[nid] >= freq:
+                    break
+                max_freq[nid] = freq
+            prev = word
+
+        self._total_nodes += created
+        self._total_words += added
+
+    def compact(self):
+        """
+        Renumber nodes in breadth-first order so each node's children
+        occupy consecutive ids, and drop slots freed by remove().
+        Node ids are not stable across calls. Nothing calls this
+        automatically; it is mainly useful after many remove() calls,
+        since renumbering did not measurably speed up queries on a
+        freshly loaded trie.
+        Complexity: O(T + sum of C log C) for sorting each node's children
+        """
+        children = self._children
+        is_word = self._is_word
+        freq = self._freq
+        max_freq = self._max_freq
+
+        order = [ROOT]  # new id -> old id; grows while iterated (BFS queue)
+        new_children = []
+        for old in order:
+            kids = children[old]
+            if not kids:
+                new_children.append(_LEAF)
+                continue
+            remapped = {}
+            for ch, nxt in sorted(kids.items()):
+                remapped[ch] = len(order)
+                order.append(nxt)
+            new_children.append(remapped)
+
+        self._is_word = bytearray(is_word[old] for old in order)
+        self._freq = array('d', (freq[old] for old in order))
+        self._max_freq = array('d', (max_freq[old] for old in order))
+        self._children = new_children
+        self._free = []
 
     def remove(self, word):
         """
@@ -74,84 +285,150 @@ class Trie:
         Returns True if removed, False if not found.
         Complexity: O(L)
         """
-        node, path = self._trace(word)
-        if not node or not node.is_word:
+        node, nodes = self._trace(word)
+        is_word = self._is_word
+        if node < 0 or not is_word[node]:
             return False
 
-        node.is_word = False
-        node.freq = 0.0
+        is_word[node] = 0
+        self._freq[node] = 0.0
         self._total_words -= 1
+        self._complete_cache.clear()
+
+        children = self._children
+        if children[node]:
+            # still an inner node: nothing to prune
+            self._refresh_max(nodes)
+            return True
 
         # prune unnecessary nodes from bottom up
-        for i in range(len(path) - 1, 0, -1):
-            parent, ch = path[i - 1]
-            child, _ = path[i]
-            if not child.children and not child.is_word:
-                if ch in parent.children:
-                    del parent.children[ch]
-                    self._total_nodes -= 1
-            else:
+        depth = len(nodes) - 1
+        while depth > 0:
+            child = nodes[depth]
+            if children[child] or is_word[child]:
                 break
+            kids = children[nodes[depth - 1]]
+            del kids[word[depth - 1]]
+            if not kids:
+                children[nodes[depth - 1]] = _LEAF
+            self._free.append(child)
+            self._total_nodes -= 1
+            depth -= 1
+
+        del nodes[depth + 1:]
+        self._refresh_max(nodes)
         return True
 
     def contains(self, word):
         """Return True if exact word exists. Complexity: O(L)."""
-        node, _ = self._trace(word)
-        return node is not None and node.is_word
+        node = self._find(word)
+        return node >= 0 and bool(self._is_word[node])
 
     def complete(self, prefix, k):
         """
         Return up to k words that start with prefix,
         ranked by frequency (desc) and then alphabetically.
-        Complexity: O(M + N log K)
+        Results are memoized per (prefix, k) until the next mutation,
+        so repeated keystroke queries cost O(1).
+        Complexity: O(M + k * fanout * depth * log), O(1) on a cache hit
         """
-        node, _ = self._trace(prefix)
-        if not node:
-            return []
-
-        heap = []  # (freq, word)
+        cache = self._complete_cache
+        key = (prefix, k)
+        result = cache.get(key)
+        if result is None:
+            result = self._complete_uncached(prefix, k)
+            if len(cache) >= COMPLETE_CACHE_SIZE:
+                cache.popitem(last=False)
+            cache[key] = result
+        else:
+            cache.move_to_end(key)
+        return list(result)
 
-        def dfs(cur_node, built):
-            if cur_node.is_word:
-                item = (cur_node.freq, built)
-                if len(heap) < k:
-                    heapq.heappush(heap, item)
-                else:
-                    heapq.heappushpop(heap, item)
+    def _complete_uncached(self, prefix, k):
+        """Compute complete(prefix, k) as a tuple, bypassing the cache."""
+        node = self._find(prefix)
+        if node < 0:
+            return ()
+        return self._top_k(node, prefix, k)
 
-            for ch in sorted(cur_node.children.keys()):
-                dfs(cur_node.children[ch], built + ch)
-
-        dfs(node, prefix)
+    def _top_k(self, node, prefix, k):
+        """
+        Best-first search below node. Heap entries are keyed
+        (-bound, text): a subtree's bound is its _max_freq and its text
+        a prefix of every word in it, so its key never exceeds theirs.
+        Words therefore pop in final ranking order, and subtrees that
+        cannot reach the top k are never expanded.
+        Complexity: O(E log E) for E entries pushed, ~ k * fanout * depth
+        """
+        if k <= 0:
+            return ()
+        is_word = self._is_word
+        freq = self._freq
+        children = self._children
+        max_freq = self._max_freq
+        push = heapq.heappush
+        pop = heapq.heappop
 
-        # sort by descending freq, ascending word
-        result = sorted(heap, key=lambda x: (-x[0], x[1]))
-        return [word for _, word in result]
+        result = []
+        # (-bound, text, is_subtree, node); a word sorts before its own subtree
+        heap = [(-max_freq[node], prefix, 1, node)]
+        while heap:
+            _, text, is_subtree, nid = pop(heap)
+            if not is_subtree:
+                result.append(text)
+                if len(result) == k:
+                    break
+                continue
+            if is_word[nid]:
+                push(heap, (-freq[nid], text, 0, nid))
+            for ch, child in children[nid].items():
+                push(heap, (-max_freq[child], text + ch, 1, child))
+        return tuple(result)
 
     def stats(self):
         """
         Return (num_words, height, num_nodes).
-        Complexity: O(T) to compute height.
+        Complexity: O(T) to compute height, level by level (BFS).
         """
-        def height(node):
-            if not node.children:
-                return 0
-            return 1 + max(height(child) for child in node.children.values())
+        children = self._children
+        height = 0
+        level = [ROOT]
+        while True:
+            level = [nxt for nid in level for nxt in children[nid].values()]
+            if not level:
+                break
+            height += 1
 
-        return (self._total_words, height(self.root), self._total_nodes)
+        return (self._total_words, height, self._total_nodes)
 
     def items(self):
         """
         Return list of all (word, freq) pairs stored in the Trie.
         Complexity: O(T)
         """
-        pairs = []
+        return list(self.iter_items())
 
-        def gather(node, prefix):
-            if node.is_word:
-                pairs.append((prefix, node.freq))
-            for ch, nxt in node.children.items():
-                gather(nxt, prefix + ch)
+    def iter_items(self):
+        """
+        Lazily yield every (word, freq) pair stored in the Trie, in the
+        same order as items(), without building the full list.
+        Do not mutate the Trie while consuming it.
+        Complexity: O(T) overall
+        """
+        is_word = self._is_word
+        freq = self._freq
+        children = self._children
 
-        gather(self.root, "")
-        return pairs
+        # explicit stack in place of recursion; children are pushed in
+        # reverse so words come out in pre-order
+        stack = [(ROOT, "")]
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            nid, word = pop()
+            if is_word[nid]:
+                yield word, freq[nid]
+            kids = children[nid]
+            if kids:
+                for ch, nxt in reversed(kids.items()):
+                    push((nxt, word + ch))
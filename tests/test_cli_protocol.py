@@ -38,3 +38,24 @@ quit
     # First line is OK/MISS depending on presence of 'zebra'
     assert out[0] in ("OK", "MISS")
     assert out[1].startswith('words=') and 'height=' in out[1] and 'nodes=' in out[1]
+
+
+def test_cli_load_uses_mmap_for_large_files(monkeypatch, capsys):
+    import src.app as app
+    calls = []
+    real = app.load_csv_mmap
+
+    def spy(path):
+        calls.append(path)
+        return real(path)
+
+    monkeypatch.setattr(app, 'MMAP_MIN_BYTES', 0)
+    monkeypatch.setattr(app, 'load_csv_mmap', spy)
+    trie = app.Trie()
+    for line in (f"load {RES}", "complete he 3", "stats"):
+        keep_running, trie = app.execute_command(line, trie)
+        assert keep_running
+    assert calls == [str(RES)]
+    out = capsys.readouterr().out.splitlines()
+    assert out[0] == 'hello,help,hell'
+    assert out[1].startswith('words=11 ')
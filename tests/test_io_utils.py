@@ -0,0 +1,51 @@
+# tests/test_io_utils.py
+import csv
+
+from src.io_utils import load_csv, load_csv_mmap, save_csv
+
+ROWS = [
+    ('plain', 1.5),
+    ('comma,word', 2.0),
+    ('say "hi"', 3.0),
+    ('two\nlines', 4.0),
+    ('carriage\rreturn', 5.0),
+    ('a\r\nb', 6.0),
+    ('', 0.0),
+    ('big', float('inf')),
+    ('neg', -0.0),
+]
+
+
+def test_save_csv_quotes_like_csv_writer_and_round_trips(tmp_path):
+    out = tmp_path / 'out.csv'
+    save_csv(out, iter(ROWS))
+
+    expected = tmp_path / 'expected.csv'
+    with open(expected, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        for row in ROWS:
+            writer.writerow(row)
+    assert out.read_bytes() == expected.read_bytes()
+
+    assert load_csv(out) == ROWS
+
+
+def test_load_csv_mmap_falls_back_for_quoted_files(tmp_path):
+    path = tmp_path / 'quoted.csv'
+    path.write_bytes(b'"comma,word",2\r\nplain,1\r\n"say ""hi""",3\r\n')
+    assert load_csv_mmap(path) == [('comma,word', 2.0), ('plain', 1.0), ('say "hi"', 3.0)]
+    assert load_csv_mmap(path) == load_csv(path)
+
+
+def test_load_csv_mmap_parses_crlf_without_fallback(tmp_path, monkeypatch):
+    import src.io_utils as io_utils
+    path = tmp_path / 'crlf.csv'
+    path.write_bytes(b'Alpha,1\r\nbeta,2.5\r\n\r\ngamma,x\rdelta\r\n')
+    expected = load_csv(path)
+    assert expected == [('alpha', 1.0), ('beta', 2.5), ('gamma', 0.0), ('delta', 0.0)]
+
+    def no_fallback(file_path):
+        raise AssertionError('load_csv_mmap fell back to load_csv')
+
+    monkeypatch.setattr(io_utils, 'load_csv', no_fallback)
+    assert io_utils.load_csv_mmap(path) == expected
@@ -1,7 +1,7 @@
 # tests/test_trie_basic.py
 from src.trie import Trie
 from pathlib import Path
-from src.io_utils import load_csv
+from src.io_utils import load_csv, load_csv_mmap
 
 RES = Path(__file__).parent / 'resources' / 'small_words.csv'
 
@@ -26,6 +26,7 @@ def test_tie_break_lexicographic():
     t.insert('ab', 1.0)
     t.insert('ac', 1.0)
     assert t.complete('a', 3) == ['aa', 'ab', 'ac']
+    assert t.complete('a', 2) == ['aa', 'ab']
 
 
 def test_remove_then_missing():
@@ -82,3 +83,87 @@ def test_update_frequency_affects_ranking():
     t.insert('helium', 10)
     out = t.complete('he', 2)
     assert out == ['helium', 'hello']
+
+
+def test_remove_prunes_only_its_own_branch():
+    t = Trie()
+    t.insert('xx', 1.0)
+    t.insert('xc', 2.0)
+    assert t.remove('xc') is True
+    assert t.contains('xx')
+    assert t.stats() == (1, 2, 3)
+
+
+def test_insert_many_matches_insert():
+    pairs = load_csv(RES) + [('help', 9.0), ('he', 1.0)]
+    one, bulk = Trie(), Trie()
+    for w, s in pairs:
+        one.insert(w, s)
+    bulk.insert_many(pairs)
+    assert sorted(bulk.items()) == sorted(one.items())
+    assert bulk.stats() == one.stats()
+    assert bulk.complete('he', 3) == ['help', 'hello', 'hell']
+
+
+def test_leaf_nodes_do_not_share_children():
+    t = Trie()
+    t.insert('ab', 1.0)
+    t.remove('ab')
+    t.insert('cd', 2.0)
+    assert Trie().complete('', 5) == []
+    assert t.items() == [('cd', 2.0)]
+
+
+def test_compact_keeps_contents_and_drops_free_slots():
+    t = Trie()
+    t.insert_many(load_csv(RES))
+    t.remove('zebra')
+    before = (sorted(t.items()), t.stats(), t.complete('he', 4))
+    t.compact()
+    assert (sorted(t.items()), t.stats(), t.complete('he', 4)) == before
+    t.insert('zoo', 1.0)
+    assert t.contains('zoo') and t.contains('zen')
+
+
+def test_complete_sees_updates_after_repeated_queries():
+    t = Trie()
+    t.insert('hello', 1)
+    assert t.complete('he', 2) == ['hello']
+    t.insert('helium', 10)
+    assert t.complete('he', 2) == ['helium', 'hello']
+    t.remove('helium')
+    assert t.complete('he', 2) == ['hello']
+
+
+def test_ranking_after_lowering_and_removal():
+    t = Trie()
+    t.insert_many(load_csv(RES))
+    t.insert('hello', 1.0)
+    assert t.complete('he', 2) == ['help', 'hell']
+    t.remove('help')
+    assert t.complete('hel', 2) == ['hell', 'helmet']
+    t.insert_many([('heat', 9.0), ('hell', 0.5)])
+    assert t.complete('he', 3) == ['heat', 'helmet', 'heap']
+
+
+def test_iter_items_is_lazy_and_matches_items():
+    t = Trie()
+    t.insert_many(load_csv(RES))
+    it = t.iter_items()
+    assert not isinstance(it, list)
+    assert list(it) == t.items()
+
+
+def test_trie_freed_without_cycle_collector():
+    import gc
+    import weakref
+    t = Trie()
+    t.insert('hello', 1.0)
+    t.complete('he', 1)
+    ref = weakref.ref(t)
+    gc.disable()
+    try:
+        del t
+        assert ref() is None
+    finally:
+        gc.enable()